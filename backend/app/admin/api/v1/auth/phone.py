@@ -163,7 +163,7 @@ async def phone_login(
 
     # 获取 LLM Token
     api_key = await api_key_service.get_or_create_default_key(db, user.id)
-    llm_token = api_key._decrypted_key
+    llm_token = api_key.decrypted_key
 
     # 构建用户信息
     user_info = PhoneLoginUserInfo(
@@ -218,7 +218,7 @@ async def get_llm_token(
 
     return response_base.success(
         data=GetLLMTokenResponse(
-            api_token=api_key._decrypted_key,
+            api_token=api_key.decrypted_key,
             expires_at=api_key.expires_at,
         )
     )
@@ -5,6 +5,7 @@ from typing import Annotated
 from fastapi import APIRouter, Depends, Query
 
 from backend.app.llm.schema.model_config import (
+    BulkUpdateModelConfigParam,
     CreateModelConfigParam,
     GetModelConfigDetail,
     GetModelConfigList,
@@ -76,6 +77,21 @@ async def create_model(db: CurrentSession, obj: CreateModelConfigParam) -> Respo
     return response_base.success()
 
 
+@router.put(
+    '',
+    summary='批量更新模型配置',
+    dependencies=[
+        Depends(RequestPermission('llm:model:edit')),
+        DependsRBAC,
+    ],
+)
+async def bulk_update_models(db: CurrentSession, obj: BulkUpdateModelConfigParam) -> ResponseSchemaModel:
+    count = await model_service.bulk_update(db, obj)
+    if count > 0:
+        return response_base.success()
+    return response_base.fail()
+
+
 @router.put(
     '/{pk}',
     summary='更新模型配置',
@@ -5,6 +5,7 @@ from typing import Annotated
 from fastapi import APIRouter, Depends, Query
 
 from backend.app.llm.schema.provider import (
+    BulkUpdateProviderParam,
     CreateProviderParam,
     GetProviderDetail,
     GetProviderList,
@@ -58,6 +59,21 @@ async def create_provider(db: CurrentSession, obj: CreateProviderParam) -> Respo
     return response_base.success()
 
 
+@router.put(
+    '',
+    summary='批量更新供应商',
+    dependencies=[
+        Depends(RequestPermission('llm:provider:edit')),
+        DependsRBAC,
+    ],
+)
+async def bulk_update_providers(db: CurrentSession, obj: BulkUpdateProviderParam) -> ResponseSchemaModel:
+    count = await provider_service.bulk_update(db, obj)
+    if count > 0:
+        return response_base.success()
+    return response_base.fail()
+
+
 @router.put(
     '/{pk}',
     summary='更新供应商',
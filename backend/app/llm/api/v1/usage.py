@@ -10,6 +10,7 @@ from backend.app.llm.schema.usage_log import (
     GetUsageLogList,
     ModelUsage,
     QuotaInfo,
+    UsageDashboard,
     UsageSummary,
 )
 from backend.app.llm.service.api_key_service import api_key_service
@@ -69,6 +70,22 @@ async def get_model_usage(
     return response_base.success(data=data)
 
 
+@router.get(
+    '/dashboard',
+    summary='获取用量看板',
+    description='一次返回用量汇总、每日用量与模型用量',
+    dependencies=[DependsJwtAuth],
+)
+async def get_usage_dashboard(
+    request: Request,
+    db: CurrentSession,
+    days: Annotated[int, Query(description='天数', ge=1, le=365)] = 30,
+) -> ResponseSchemaModel[UsageDashboard]:
+    user_id = request.user.id
+    data = await usage_service.get_dashboard(db, user_id=user_id, days=days)
+    return response_base.success(data=data)
+
+
 @router.get(
     '/logs',
     summary='获取用量日志',
@@ -108,11 +125,8 @@ async def get_quota_info(
     # 提取 API Key
     api_key = authorization.replace('Bearer ', '') if authorization.startswith('Bearer ') else authorization
 
-    # 验证 API Key
-    api_key_record = await api_key_service.verify_api_key(db, api_key)
-
-    # 获取速率限制
-    rate_limits = await api_key_service.get_rate_limits(db, api_key_record)
+    # 验证 API Key 并获取速率限制
+    api_key_record, rate_limits = await api_key_service.verify_api_key_with_rate_limits(db, api_key)
 
     # 获取配额信息
     data = await usage_service.get_quota_info(
@@ -0,0 +1,8 @@
+"""数据库查询并发控制"""
+
+import asyncio
+
+from backend.core.conf import settings
+
+# 列表/统计类查询并发上限，避免突发流量耗尽数据库连接池
+db_query_semaphore = asyncio.Semaphore(settings.LLM_DB_CONCURRENCY)
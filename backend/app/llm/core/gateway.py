@@ -16,7 +16,6 @@ from backend.app.llm.core.rate_limiter import rate_limiter
 from backend.app.llm.core.usage_tracker import RequestTimer, usage_tracker
 from backend.app.llm.crud.crud_model_config import model_config_dao
 from backend.app.llm.crud.crud_model_group import model_group_dao
-from backend.app.llm.crud.crud_provider import provider_dao
 from backend.app.llm.model.model_config import ModelConfig
 from backend.app.llm.model.provider import ModelProvider
 from backend.app.llm.schema.proxy import (
@@ -29,6 +28,7 @@ from backend.app.llm.schema.proxy import (
     ChatCompletionUsage,
     ChatMessage,
 )
+from backend.app.llm.service.provider_service import ProviderSnapshot, provider_service
 from backend.common.exception.errors import HTTPError
 from backend.common.log import log
 
@@ -77,9 +77,9 @@ class LLMGateway:
             raise ModelNotFoundError(model_name)
         return model
 
-    async def _get_provider(self, db: AsyncSession, provider_id: int) -> ModelProvider:
+    async def _get_provider(self, db: AsyncSession, provider_id: int) -> ProviderSnapshot:
         """获取供应商"""
-        provider = await provider_dao.get(db, provider_id)
+        provider = await provider_service.get_cached(db, provider_id)
         if not provider or not provider.enabled:
             raise ProviderUnavailableError(f'Provider ID: {provider_id}')
         return provider
@@ -96,13 +96,14 @@ class LLMGateway:
         if not group or not group.fallback_enabled:
             return []
 
+        model_ids = [model_id for model_id in group.model_ids if model_id != exclude_model_id]
+        models = await model_config_dao.get_enabled_by_ids(db, model_ids)
+
         fallback_models = []
-        for model_id in group.model_ids:
-            if model_id == exclude_model_id:
-                continue
-            model = await model_config_dao.get(db, model_id)
-            if model and model.enabled:
-                provider = await provider_dao.get(db, model.provider_id)
+        for model_id in model_ids:
+            model = models.get(model_id)
+            if model:
+                provider = model.provider
                 if provider and provider.enabled:
                     breaker = self._get_circuit_breaker(provider.name)
                     if breaker.allow_request():
@@ -113,7 +114,7 @@ class LLMGateway:
     def _build_litellm_params(
         self,
         model_config: ModelConfig,
-        provider: ModelProvider,
+        provider: ModelProvider | ProviderSnapshot,
         request: ChatCompletionRequest,
     ) -> dict[str, Any]:
         """构建 LiteLLM 调用参数"""
@@ -265,7 +266,6 @@ class LLMGateway:
 
             # 记录用量
             await usage_tracker.track_success(
-                db,
                 user_id=user_id,
                 api_key_id=api_key_id,
                 model_id=model_config.id,
@@ -318,7 +318,6 @@ class LLMGateway:
 
             # 记录错误
             await usage_tracker.track_error(
-                db,
                 user_id=user_id,
                 api_key_id=api_key_id,
                 model_id=model_config.id,
@@ -434,7 +433,6 @@ class LLMGateway:
 
             # 记录用量
             await usage_tracker.track_success(
-                db,
                 user_id=user_id,
                 api_key_id=api_key_id,
                 model_id=model_config.id,
@@ -459,7 +457,6 @@ class LLMGateway:
 
             # 记录错误
             await usage_tracker.track_error(
-                db,
                 user_id=user_id,
                 api_key_id=api_key_id,
                 model_id=model_config.id,
@@ -163,9 +163,13 @@ class RateLimiter:
         :param monthly_limit: 月 Token 限制
         :return: 使用情况字典
         """
-        current_rpm = await self.get_current_rpm(api_key_id)
-        daily_tokens = await self.get_daily_tokens(api_key_id)
-        monthly_tokens = await self.get_monthly_tokens(api_key_id)
+        # 单次 MGET 读取全部计数
+        values = await redis_client.mget(
+            self._get_rpm_key(api_key_id),
+            self._get_daily_key(api_key_id),
+            self._get_monthly_key(api_key_id),
+        )
+        current_rpm, daily_tokens, monthly_tokens = (int(v or 0) for v in values)
 
         return {
             'rpm_limit': rpm_limit,
@@ -1,18 +1,26 @@
 """用量追踪器实现"""
 
+import asyncio
 import time
 import uuid
 
+from asyncio import Queue
 from decimal import Decimal
 
-from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.exc import IntegrityError
 
 from backend.app.llm.crud.crud_usage_log import usage_log_dao
 from backend.app.llm.enums import UsageLogStatus
+from backend.common.log import log
+from backend.common.queue import batch_dequeue
+from backend.core.conf import settings
+from backend.database.db import async_db_session
 
 
 class UsageTracker:
-    """用量追踪器"""
+    """用量追踪器，调用记录先入队，由后台消费者批量入库"""
+
+    usage_log_queue: Queue = Queue(maxsize=settings.LLM_USAGE_LOG_QUEUE_MAXSIZE)
 
     @staticmethod
     def generate_request_id() -> str:
@@ -42,7 +50,6 @@ class UsageTracker:
 
     async def track_success(
         self,
-        db: AsyncSession,
         *,
         user_id: int,
         api_key_id: int,
@@ -61,7 +68,6 @@ class UsageTracker:
         """
         记录成功调用
 
-        :param db: 数据库会话
         :param user_id: 用户 ID
         :param api_key_id: API Key ID
         :param model_id: 模型 ID
@@ -80,31 +86,27 @@ class UsageTracker:
             input_tokens, output_tokens, input_cost_per_1k, output_cost_per_1k
         )
 
-        await usage_log_dao.create(
-            db,
-            {
-                'user_id': user_id,
-                'api_key_id': api_key_id,
-                'model_id': model_id,
-                'provider_id': provider_id,
-                'request_id': request_id,
-                'model_name': model_name,
-                'input_tokens': input_tokens,
-                'output_tokens': output_tokens,
-                'total_tokens': input_tokens + output_tokens,
-                'input_cost': input_cost,
-                'output_cost': output_cost,
-                'total_cost': total_cost,
-                'latency_ms': latency_ms,
-                'status': UsageLogStatus.SUCCESS,
-                'is_streaming': is_streaming,
-                'ip_address': ip_address,
-            },
-        )
+        await self.usage_log_queue.put({
+            'user_id': user_id,
+            'api_key_id': api_key_id,
+            'model_id': model_id,
+            'provider_id': provider_id,
+            'request_id': request_id,
+            'model_name': model_name,
+            'input_tokens': input_tokens,
+            'output_tokens': output_tokens,
+            'total_tokens': input_tokens + output_tokens,
+            'input_cost': input_cost,
+            'output_cost': output_cost,
+            'total_cost': total_cost,
+            'latency_ms': latency_ms,
+            'status': UsageLogStatus.SUCCESS.value,
+            'is_streaming': is_streaming,
+            'ip_address': ip_address,
+        })
 
     async def track_error(
         self,
-        db: AsyncSession,
         *,
         user_id: int,
         api_key_id: int,
@@ -120,7 +122,6 @@ class UsageTracker:
         """
         记录失败调用
 
-        :param db: 数据库会话
         :param user_id: 用户 ID
         :param api_key_id: API Key ID
         :param model_id: 模型 ID
@@ -132,28 +133,112 @@ class UsageTracker:
         :param is_streaming: 是否流式
         :param ip_address: IP 地址
         """
-        await usage_log_dao.create(
-            db,
-            {
-                'user_id': user_id,
-                'api_key_id': api_key_id,
-                'model_id': model_id,
-                'provider_id': provider_id,
-                'request_id': request_id,
-                'model_name': model_name,
-                'input_tokens': 0,
-                'output_tokens': 0,
-                'total_tokens': 0,
-                'input_cost': Decimal(0),
-                'output_cost': Decimal(0),
-                'total_cost': Decimal(0),
-                'latency_ms': latency_ms,
-                'status': UsageLogStatus.ERROR,
-                'error_message': error_message,
-                'is_streaming': is_streaming,
-                'ip_address': ip_address,
-            },
-        )
+        await self.usage_log_queue.put({
+            'user_id': user_id,
+            'api_key_id': api_key_id,
+            'model_id': model_id,
+            'provider_id': provider_id,
+            'request_id': request_id,
+            'model_name': model_name,
+            'input_tokens': 0,
+            'output_tokens': 0,
+            'total_tokens': 0,
+            'input_cost': Decimal(0),
+            'output_cost': Decimal(0),
+            'total_cost': Decimal(0),
+            'latency_ms': latency_ms,
+            'status': UsageLogStatus.ERROR.value,
+            'error_message': error_message,
+            'is_streaming': is_streaming,
+            'ip_address': ip_address,
+        })
+
+    @staticmethod
+    async def _bulk_create(logs: list[dict]) -> Exception | None:
+        """
+        单次批量写入用量日志
+
+        :param logs: 用量日志数据列表
+        :return: 写入失败时返回异常
+        """
+        try:
+            async with async_db_session.begin() as db:
+                await usage_log_dao.bulk_create(db, logs)
+        except Exception as e:
+            return e
+        return None
+
+    @classmethod
+    async def _write_one_by_one(cls, logs: list[dict]) -> None:
+        """
+        逐条写入用量日志，单条失败只丢弃该条
+
+        :param logs: 用量日志数据列表
+        :return:
+        """
+        for item in logs:
+            error = await cls._bulk_create([item])
+            if error is not None:
+                log.error(f'用量日志入库失败，丢弃请求 {item["request_id"]} 的日志: {error}')
+
+    @classmethod
+    async def _write(cls, logs: list[dict]) -> None:
+        """
+        批量写入用量日志，失败时按次数重试；数据冲突时不再重试，改为逐条写入
+
+        :param logs: 用量日志数据列表
+        :return:
+        """
+        # request_id 唯一，同一请求可能先后记录成功与失败，保留先入队的一条
+        unique_logs: dict[str, dict] = {}
+        for item in logs:
+            unique_logs.setdefault(item['request_id'], item)
+        logs = list(unique_logs.values())
+
+        retries = settings.LLM_USAGE_LOG_WRITE_RETRIES
+        for attempt in range(1, retries + 1):
+            error = await cls._bulk_create(logs)
+            if error is None:
+                return
+            if isinstance(error, IntegrityError):
+                log.warning(f'用量日志批量入库存在冲突数据，改为逐条写入: {error}')
+                await cls._write_one_by_one(logs)
+                return
+            if attempt < retries:
+                log.warning(f'用量日志入库失败，第 {attempt} 次重试: {error}')
+                await asyncio.sleep(attempt)
+            else:
+                log.error(f'用量日志入库失败，丢失 {len(logs)} 条日志: {error}')
+
+    @classmethod
+    async def consumer(cls) -> None:
+        """用量日志消费者，收到停止标记（None）后写入剩余日志并退出"""
+        while True:
+            items = await batch_dequeue(
+                cls.usage_log_queue,
+                max_items=settings.LLM_USAGE_LOG_QUEUE_BATCH_CONSUME_SIZE,
+                timeout=settings.LLM_USAGE_LOG_QUEUE_TIMEOUT,
+            )
+            logs = [item for item in items if item is not None]
+            try:
+                if logs:
+                    await cls._write(logs)
+            finally:
+                for _ in range(len(items)):
+                    cls.usage_log_queue.task_done()
+            if len(logs) < len(items):
+                return
+
+    @classmethod
+    async def shutdown(cls, consumer_task: asyncio.Task) -> None:
+        """
+        停止消费者，等待队列中剩余日志写入完成
+
+        :param consumer_task: 消费者任务
+        :return:
+        """
+        await cls.usage_log_queue.put(None)
+        await consumer_task
 
 
 class RequestTimer:
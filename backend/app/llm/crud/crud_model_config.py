@@ -1,10 +1,13 @@
 """模型配置 CRUD"""
 
-from sqlalchemy import Select, select
+from typing import Any
+
+from sqlalchemy import Select, exists, false, func, select, true
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
+from sqlalchemy.orm import joinedload, selectinload
 from sqlalchemy_crud_plus import CRUDPlus
 
+from backend.app.llm.enums import ProviderType
 from backend.app.llm.model.model_config import ModelConfig
 from backend.app.llm.model.provider import ModelProvider
 from backend.app.llm.schema.model_config import CreateModelConfigParam, UpdateModelConfigParam
@@ -14,11 +17,41 @@ class CRUDModelConfig(CRUDPlus[ModelConfig]):
     """模型配置数据库操作类"""
 
     async def get(self, db: AsyncSession, pk: int) -> ModelConfig | None:
-        return await self.select_model(db, pk)
+        stmt = select(ModelConfig).options(joinedload(ModelConfig.provider)).where(ModelConfig.id == pk)
+        result = await db.execute(stmt)
+        return result.scalars().first()
 
     async def get_by_name(self, db: AsyncSession, model_name: str) -> ModelConfig | None:
         return await self.select_model_by_column(db, model_name=model_name)
 
+    async def validate_create(
+        self,
+        db: AsyncSession,
+        provider_id: int | None,
+        model_name: str | None,
+        *,
+        exclude_pk: int | None = None,
+    ) -> tuple[bool, bool]:
+        """
+        单条语句检查供应商是否存在及模型名称是否已被占用
+
+        :param db: 数据库会话
+        :param provider_id: 供应商 ID，为 None 时跳过检查
+        :param model_name: 模型名称，为 None 时跳过检查
+        :param exclude_pk: 检查名称占用时排除的模型 ID
+        :return: (供应商是否存在, 模型名称是否已被占用)
+        """
+        provider_exists = exists().where(ModelProvider.id == provider_id) if provider_id is not None else true()
+        if model_name is not None:
+            name_taken = exists().where(ModelConfig.model_name == model_name)
+            if exclude_pk is not None:
+                name_taken = name_taken.where(ModelConfig.id != exclude_pk)
+        else:
+            name_taken = false()
+        result = await db.execute(select(provider_exists, name_taken))
+        row = result.one()
+        return bool(row[0]), bool(row[1])
+
     async def get_list(
         self,
         *,
@@ -78,15 +111,43 @@ class CRUDModelConfig(CRUDPlus[ModelConfig]):
             stmt = stmt.where(ModelConfig.enabled == enabled)
         return stmt
 
-    async def get_all_enabled(self, db: AsyncSession) -> list[ModelConfig]:
+    async def get_all_enabled(self) -> Select:
+        """获取所有启用模型（带供应商类型，缺省值在 SQL 中补齐，列名与 GetAvailableModel 字段一致）"""
+        return (
+            select(
+                ModelConfig.model_name.label('model_id'),
+                func.coalesce(ModelConfig.display_name, ModelConfig.model_name).label('display_name'),
+                ModelConfig.model_type,
+                ModelConfig.max_tokens,
+                ModelConfig.supports_streaming,
+                ModelConfig.supports_vision,
+                ModelConfig.supports_tools,
+                ModelConfig.priority,
+                ModelConfig.enabled,
+                func.coalesce(ModelProvider.provider_type, ProviderType.OPENAI.value).label('provider'),
+            )
+            .outerjoin(ModelProvider, ModelConfig.provider_id == ModelProvider.id)
+            .where(ModelConfig.enabled)
+            .order_by(ModelConfig.priority.desc())
+        )
+
+    async def get_enabled_by_ids(self, db: AsyncSession, pks: list[int]) -> dict[int, ModelConfig]:
+        """
+        批量获取已启用的模型配置（含供应商）
+
+        :param db: 数据库会话
+        :param pks: 模型 ID 列表
+        :return: 模型 ID 到模型配置的映射
+        """
+        if not pks:
+            return {}
         stmt = (
             select(ModelConfig)
             .options(selectinload(ModelConfig.provider))
-            .where(ModelConfig.enabled)
-            .order_by(ModelConfig.priority.desc())
+            .where(ModelConfig.id.in_(pks), ModelConfig.enabled)
         )
         result = await db.execute(stmt)
-        return list(result.scalars().all())
+        return {model.id: model for model in result.scalars()}
 
     async def get_by_provider(self, db: AsyncSession, provider_id: int) -> list[ModelConfig]:
         stmt = await self.select_order('priority', 'desc', provider_id=provider_id, enabled=True)
@@ -102,6 +163,19 @@ class CRUDModelConfig(CRUDPlus[ModelConfig]):
         await db.commit()
         return count
 
+    async def bulk_update(self, db: AsyncSession, pks: list[int], values: dict[str, Any]) -> int:
+        """
+        单条语句批量更新模型配置
+
+        :param db: 数据库会话
+        :param pks: 模型 ID 列表
+        :param values: 更新字段
+        :return: 更新行数
+        """
+        count = await self.update_model_by_column(db, values, allow_multiple=True, id__in=pks)
+        await db.commit()
+        return count
+
     async def delete(self, db: AsyncSession, pk: int) -> int:
         count = await self.delete_model(db, pk)
         await db.commit()
@@ -1,5 +1,7 @@
 """模型供应商 CRUD"""
 
+from typing import Any
+
 from sqlalchemy import Select
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy_crud_plus import CRUDPlus
@@ -50,6 +52,19 @@ class CRUDProvider(CRUDPlus[ModelProvider]):
         await db.commit()
         return count
 
+    async def bulk_update(self, db: AsyncSession, pks: list[int], values: dict[str, Any]) -> int:
+        """
+        单条语句批量更新供应商
+
+        :param db: 数据库会话
+        :param pks: 供应商 ID 列表
+        :param values: 更新字段
+        :return: 更新行数
+        """
+        count = await self.update_model_by_column(db, values, allow_multiple=True, id__in=pks)
+        await db.commit()
+        return count
+
     async def delete(self, db: AsyncSession, pk: int) -> int:
         count = await self.delete_model(db, pk)
         await db.commit()
@@ -3,12 +3,14 @@
 from datetime import date, datetime, timedelta
 from decimal import Decimal
 
-from sqlalchemy import Select, func, select
+from sqlalchemy import Row, Select, case, func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy_crud_plus import CRUDPlus
 
+from backend.app.llm.enums import UsageLogStatus
 from backend.app.llm.model.usage_log import UsageLog
 from backend.app.llm.schema.usage_log import DailyUsage, ModelUsage, UsageSummary
+from backend.utils.timezone import timezone
 
 
 class CRUDUsageLog(CRUDPlus[UsageLog]):
@@ -52,6 +54,16 @@ class CRUDUsageLog(CRUDPlus[UsageLog]):
         await db.refresh(new_obj)
         return new_obj
 
+    async def bulk_create(self, db: AsyncSession, objs: list[dict]) -> None:
+        """
+        批量创建用量日志
+
+        :param db: 数据库会话
+        :param objs: 用量日志数据列表
+        :return:
+        """
+        db.add_all([self.model(**obj) for obj in objs])
+
     async def get_summary(
         self,
         db: AsyncSession,
@@ -163,6 +175,42 @@ class CRUDUsageLog(CRUDPlus[UsageLog]):
             for row in rows
         ]
 
+    async def get_dashboard(self, db: AsyncSession, *, user_id: int, days: int = 30) -> list[Row]:
+        """
+        获取用量看板数据
+
+        单次扫描按日期与模型分组，汇总、每日及模型用量均可由结果推导
+
+        :param db: 数据库会话
+        :param user_id: 用户 ID
+        :param days: 天数
+        :return:
+        """
+        start_date = timezone.now().date() - timedelta(days=days - 1)
+        day = func.date(UsageLog.created_time)
+        stmt = (
+            select(
+                day.label('date'),
+                UsageLog.model_name,
+                func.count(UsageLog.id).label('requests'),
+                func.sum(case((UsageLog.status == UsageLogStatus.SUCCESS.value, 1), else_=0)).label('success_requests'),
+                func.sum(case((UsageLog.status == UsageLogStatus.ERROR.value, 1), else_=0)).label('error_requests'),
+                func.coalesce(func.sum(UsageLog.total_tokens), 0).label('tokens'),
+                func.coalesce(func.sum(UsageLog.input_tokens), 0).label('input_tokens'),
+                func.coalesce(func.sum(UsageLog.output_tokens), 0).label('output_tokens'),
+                func.coalesce(func.sum(UsageLog.total_cost), Decimal(0)).label('cost'),
+                func.coalesce(func.sum(UsageLog.latency_ms), 0).label('latency_ms'),
+            )
+            .where(
+                UsageLog.user_id == user_id,
+                UsageLog.created_time >= datetime.combine(start_date, datetime.min.time()),
+            )
+            .group_by(day, UsageLog.model_name)
+        )
+
+        result = await db.execute(stmt)
+        return list(result.all())
+
     async def get_tokens_today(self, db: AsyncSession, *, user_id: int) -> int:
         """获取今日 tokens"""
         today = date.today()
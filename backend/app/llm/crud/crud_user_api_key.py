@@ -4,6 +4,7 @@ from sqlalchemy import Select
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy_crud_plus import CRUDPlus
 
+from backend.app.llm.enums import ApiKeyStatus
 from backend.app.llm.model.user_api_key import UserApiKey
 from backend.app.llm.schema.user_api_key import CreateUserApiKeyParam, UpdateUserApiKeyParam
 from backend.utils.timezone import timezone
@@ -58,7 +59,7 @@ class CRUDUserApiKey(CRUDPlus[UserApiKey]):
             'key_prefix': key_prefix,
             'key_hash': key_hash,
             'key_encrypted': key_encrypted,
-            'status': 'ACTIVE',
+            'status': ApiKeyStatus.ACTIVE,
         })
         new_obj = UserApiKey(**create_data)
         db.add(new_obj)
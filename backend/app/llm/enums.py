@@ -1,6 +1,7 @@
 """LLM 模块枚举定义"""
 
 from enum import StrEnum
+from typing import Literal
 
 
 class ProviderType(StrEnum):
@@ -49,6 +50,10 @@ class ApiKeyStatus(StrEnum):
     REVOKED = 'REVOKED'
 
 
+# API Key 状态字面量类型，与 ApiKeyStatus 取值保持一致，用于响应 Schema
+ApiKeyStatusLit = Literal['ACTIVE', 'DISABLED', 'EXPIRED', 'REVOKED']
+
+
 class UsageLogStatus(StrEnum):
     """用量日志状态"""
 
@@ -56,6 +61,10 @@ class UsageLogStatus(StrEnum):
     ERROR = 'ERROR'
 
 
+# 用量日志状态字面量类型，与 UsageLogStatus 取值保持一致，用于响应 Schema
+UsageStatusLit = Literal['SUCCESS', 'ERROR']
+
+
 class CircuitState(StrEnum):
     """熔断器状态"""
 
@@ -42,4 +42,4 @@ class ModelConfig(Base):
     enabled: Mapped[bool] = mapped_column(default=True, index=True, comment='是否启用')
 
     # 关系
-    provider: Mapped['ModelProvider'] = relationship(init=False, lazy='selectin')
+    provider: Mapped['ModelProvider'] = relationship(init=False, lazy='raise')  # 按需显式加载
@@ -1,11 +1,14 @@
 """用户 API Key 表"""
 
 from datetime import datetime
+from functools import cached_property
 
 import sqlalchemy as sa
 
 from sqlalchemy.orm import Mapped, mapped_column
 
+from backend.app.llm.core.encryption import key_encryption
+from backend.app.llm.enums import ApiKeyStatus
 from backend.common.model import Base, TimeZone, id_key
 
 
@@ -20,12 +23,27 @@ class UserApiKey(Base):
     key_prefix: Mapped[str] = mapped_column(sa.String(16), index=True, comment='Key 前缀(sk-xxx)')
     key_hash: Mapped[str] = mapped_column(sa.String(64), unique=True, index=True, comment='SHA-256 哈希')
     key_encrypted: Mapped[str] = mapped_column(sa.Text, comment='AES-256 加密的完整 Key')
-    status: Mapped[str] = mapped_column(sa.String(16), default='ACTIVE', index=True, comment='状态')
+    status: Mapped[ApiKeyStatus] = mapped_column(
+        sa.Enum(ApiKeyStatus, native_enum=False, length=16),
+        default=ApiKeyStatus.ACTIVE,
+        index=True,
+        comment='状态',
+    )
     expires_at: Mapped[datetime | None] = mapped_column(TimeZone, default=None, comment='过期时间')
-    rate_limit_config_id: Mapped[int | None] = mapped_column(sa.BigInteger, default=None, comment='速率限制配置 ID')
+    rate_limit_config_id: Mapped[int | None] = mapped_column(
+        sa.BigInteger,
+        sa.ForeignKey('llm_rate_limit_config.id', ondelete='SET NULL'),
+        default=None,
+        comment='速率限制配置 ID',
+    )
     custom_daily_tokens: Mapped[int | None] = mapped_column(default=None, comment='自定义日 Token 限制')
     custom_monthly_tokens: Mapped[int | None] = mapped_column(default=None, comment='自定义月 Token 限制')
     custom_rpm_limit: Mapped[int | None] = mapped_column(default=None, comment='自定义 RPM 限制')
     allowed_models: Mapped[list | None] = mapped_column(sa.JSON, default=None, comment='允许的模型列表')
     metadata_: Mapped[dict | None] = mapped_column('metadata', sa.JSON, default=None, comment='元数据')
     last_used_at: Mapped[datetime | None] = mapped_column(TimeZone, init=False, default=None, comment='最后使用时间')
+
+    @cached_property
+    def decrypted_key(self) -> str:
+        """完整 API Key，首次访问时解密并缓存"""
+        return key_encryption.decrypt(self.key_encrypted)
@@ -2,7 +2,7 @@
 
 from decimal import Decimal
 
-from pydantic import Field
+from pydantic import AliasChoices, AliasPath, Field
 
 from backend.app.llm.enums import ModelType
 from backend.common.schema import SchemaBase
@@ -52,11 +52,22 @@ class UpdateModelConfigParam(SchemaBase):
     enabled: bool | None = Field(default=None, description='是否启用')
 
 
+class BulkUpdateModelConfigParam(UpdateModelConfigParam):
+    """批量更新模型配置参数"""
+
+    pks: list[int] = Field(description='模型 ID 列表')
+
+
 class GetModelConfigDetail(ModelConfigBase):
     """模型配置详情"""
 
+    # 不声明 from_attributes，雪花主键模式下 id 保持按整数序列化
     id: int
-    provider_name: str | None = Field(default=None, description='供应商名称')
+    provider_name: str | None = Field(
+        default=None,
+        validation_alias=AliasChoices('provider_name', AliasPath('provider', 'name')),
+        description='供应商名称',
+    )
 
 
 class GetModelConfigList(SchemaBase):
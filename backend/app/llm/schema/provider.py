@@ -39,6 +39,12 @@ class UpdateProviderParam(SchemaBase):
     description: str | None = Field(default=None, description='描述')
 
 
+class BulkUpdateProviderParam(UpdateProviderParam):
+    """批量更新供应商参数"""
+
+    pks: list[int] = Field(description='供应商 ID 列表')
+
+
 class GetProviderDetail(ProviderBase):
     """供应商详情"""
 
@@ -161,7 +161,7 @@ class AnthropicMessageResponse(SchemaBase):
 class ErrorResponse(SchemaBase):
     """错误响应"""
 
-    error: dict = Field(description='错误信息')
+    error: dict
 
 
 class ErrorDetail(SchemaBase):
@@ -46,7 +46,7 @@ class GetRateLimitConfigDetail(RateLimitConfigBase):
 class GetRateLimitConfigList(SchemaBase):
     """速率限制配置列表项"""
 
-    model_config = {'from_attributes': True}
+    model_config = {'from_attributes': True, 'frozen': True}
 
     id: int
     name: str
@@ -5,6 +5,7 @@ from decimal import Decimal
 
 from pydantic import Field
 
+from backend.app.llm.enums import UsageStatusLit
 from backend.common.schema import SchemaBase
 
 
@@ -24,7 +25,7 @@ class UsageLogBase(SchemaBase):
     output_cost: Decimal = Decimal(0)
     total_cost: Decimal = Decimal(0)
     latency_ms: int = 0
-    status: str
+    status: UsageStatusLit
     error_message: str | None = None
     is_streaming: bool = False
     ip_address: str | None = None
@@ -40,7 +41,7 @@ class GetUsageLogDetail(UsageLogBase):
 class GetUsageLogList(SchemaBase):
     """用量日志列表项"""
 
-    model_config = {'from_attributes': True}
+    model_config = {'from_attributes': True, 'frozen': True}
 
     id: int
     model_name: str
@@ -49,7 +50,7 @@ class GetUsageLogList(SchemaBase):
     total_tokens: int
     total_cost: Decimal
     latency_ms: int
-    status: str
+    status: UsageStatusLit
     is_streaming: bool
     created_time: datetime
 
@@ -70,6 +71,8 @@ class UsageSummary(SchemaBase):
 class DailyUsage(SchemaBase):
     """每日用量"""
 
+    model_config = {'from_attributes': True, 'frozen': True}
+
     date: str = Field(description='日期 (YYYY-MM-DD)')
     requests: int = Field(description='请求数')
     tokens: int = Field(description='tokens')
@@ -79,12 +82,22 @@ class DailyUsage(SchemaBase):
 class ModelUsage(SchemaBase):
     """模型用量"""
 
+    model_config = {'from_attributes': True, 'frozen': True}
+
     model_name: str
     requests: int
     tokens: int
     cost: Decimal
 
 
+class UsageDashboard(SchemaBase):
+    """用量看板"""
+
+    summary: UsageSummary = Field(description='用量汇总')
+    daily: list[DailyUsage] = Field(description='每日用量')
+    models: list[ModelUsage] = Field(description='模型用量')
+
+
 class QuotaInfo(SchemaBase):
     """配额信息"""
 
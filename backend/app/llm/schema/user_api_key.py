@@ -4,7 +4,7 @@ from datetime import datetime
 
 from pydantic import Field
 
-from backend.app.llm.enums import ApiKeyStatus
+from backend.app.llm.enums import ApiKeyStatus, ApiKeyStatusLit
 from backend.common.schema import SchemaBase
 
 
@@ -52,11 +52,13 @@ class UpdateUserApiKeyParam(SchemaBase):
 class GetUserApiKeyDetail(SchemaBase):
     """用户 API Key 详情"""
 
+    model_config = {'populate_by_name': True}
+
     id: int
     user_id: int
     name: str
     key_prefix: str
-    status: str
+    status: ApiKeyStatusLit
     expires_at: datetime | None = None
     rate_limit_config_id: int | None = None
     custom_daily_tokens: int | None = None
@@ -71,10 +73,13 @@ class GetUserApiKeyDetail(SchemaBase):
 class GetUserApiKeyList(SchemaBase):
     """用户 API Key 列表项"""
 
+    # 不声明 from_attributes，雪花主键模式下 id 保持按整数序列化
+    model_config = {'frozen': True}
+
     id: int
     name: str
     key_prefix: str
-    status: str
+    status: ApiKeyStatusLit
     expires_at: datetime | None = None
     last_used_at: datetime | None = None
     created_time: datetime
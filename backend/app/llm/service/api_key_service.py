@@ -1,7 +1,12 @@
 """用户 API Key Service"""
 
-from typing import Any
+import asyncio
 
+from operator import attrgetter
+from typing import Any, NoReturn
+
+from pydantic import TypeAdapter
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from backend.app.llm.core.encryption import key_encryption
@@ -18,12 +23,42 @@ from backend.app.llm.schema.user_api_key import (
 )
 from backend.common.exception import errors
 from backend.common.pagination import paging_data
+from backend.core.conf import settings
+from backend.database.db import async_db_session
+from backend.database.redis import redis_client
 from backend.utils.timezone import timezone
 
+_user_keys_adapter = TypeAdapter(list[GetUserApiKeyList])
+
+_detail_fields = (
+    'id',
+    'user_id',
+    'name',
+    'key_prefix',
+    'status',
+    'expires_at',
+    'rate_limit_config_id',
+    'custom_daily_tokens',
+    'custom_monthly_tokens',
+    'custom_rpm_limit',
+    'allowed_models',
+    'metadata_',
+    'last_used_at',
+    'created_time',
+)
+_detail_getter = attrgetter(*_detail_fields)
+
 
 class ApiKeyService:
     """用户 API Key 服务"""
 
+    @staticmethod
+    def _raise_rate_limit_not_found(e: IntegrityError) -> NoReturn:
+        """将速率限制配置外键冲突转换为业务异常"""
+        if 'rate_limit_config' in str(e.orig):
+            raise errors.NotFoundError(msg='速率限制配置不存在') from e
+        raise e
+
     @staticmethod
     async def get(db: AsyncSession, pk: int) -> UserApiKey:
         """获取 API Key"""
@@ -41,22 +76,9 @@ class ApiKeyService:
         if api_key.user_id != user_id:
             raise errors.ForbiddenError(msg='无权访问此 API Key')
 
-        return GetUserApiKeyDetail(
-            id=api_key.id,
-            user_id=api_key.user_id,
-            name=api_key.name,
-            key_prefix=api_key.key_prefix,
-            status=api_key.status,
-            expires_at=api_key.expires_at,
-            rate_limit_config_id=api_key.rate_limit_config_id,
-            custom_daily_tokens=api_key.custom_daily_tokens,
-            custom_monthly_tokens=api_key.custom_monthly_tokens,
-            custom_rpm_limit=api_key.custom_rpm_limit,
-            allowed_models=api_key.allowed_models,
-            metadata=api_key.metadata_,
-            last_used_at=api_key.last_used_at,
-            created_time=api_key.created_time,
-        )
+        detail = dict(zip(_detail_fields, _detail_getter(api_key)))
+        detail['status'] = api_key.status.value
+        return GetUserApiKeyDetail.model_construct(**detail)
 
     @staticmethod
     async def get_all_keys(
@@ -75,42 +97,28 @@ class ApiKeyService:
     async def get_user_keys(db: AsyncSession, user_id: int) -> list[GetUserApiKeyList]:
         """获取用户的所有 API Keys"""
         keys = await user_api_key_dao.get_user_keys(db, user_id)
-        return [
-            GetUserApiKeyList(
-                id=k.id,
-                name=k.name,
-                key_prefix=k.key_prefix,
-                status=k.status,
-                expires_at=k.expires_at,
-                last_used_at=k.last_used_at,
-                created_time=k.created_time,
-            )
-            for k in keys
-        ]
+        return _user_keys_adapter.validate_python(keys, from_attributes=True)
 
     @staticmethod
     async def create(db: AsyncSession, obj: CreateUserApiKeyParam, user_id: int) -> CreateUserApiKeyResponse:
         """创建 API Key"""
-        # 检查速率限制配置是否存在
-        if obj.rate_limit_config_id:
-            config = await rate_limit_dao.get(db, obj.rate_limit_config_id)
-            if not config:
-                raise errors.NotFoundError(msg='速率限制配置不存在')
-
         # 生成 API Key
         full_key, display_prefix = key_encryption.generate_api_key()
         key_hash = key_encryption.hash_key(full_key)
         key_encrypted = key_encryption.encrypt(full_key)
 
-        # 创建记录
-        api_key = await user_api_key_dao.create(
-            db,
-            obj,
-            user_id=user_id,
-            key_prefix=display_prefix,
-            key_hash=key_hash,
-            key_encrypted=key_encrypted,
-        )
+        # 创建记录（速率限制配置存在性由外键约束保证）
+        try:
+            api_key = await user_api_key_dao.create(
+                db,
+                obj,
+                user_id=user_id,
+                key_prefix=display_prefix,
+                key_hash=key_hash,
+                key_encrypted=key_encrypted,
+            )
+        except IntegrityError as e:
+            ApiKeyService._raise_rate_limit_not_found(e)
 
         return CreateUserApiKeyResponse(
             id=api_key.id,
@@ -129,13 +137,11 @@ class ApiKeyService:
         if api_key.user_id != user_id:
             raise errors.ForbiddenError(msg='无权修改此 API Key')
 
-        # 检查速率限制配置是否存在
-        if obj.rate_limit_config_id:
-            config = await rate_limit_dao.get(db, obj.rate_limit_config_id)
-            if not config:
-                raise errors.NotFoundError(msg='速率限制配置不存在')
-
-        return await user_api_key_dao.update(db, pk, obj)
+        # 速率限制配置存在性由外键约束保证
+        try:
+            return await user_api_key_dao.update(db, pk, obj)
+        except IntegrityError as e:
+            ApiKeyService._raise_rate_limit_not_found(e)
 
     @staticmethod
     async def delete(db: AsyncSession, pk: int, user_id: int) -> int:
@@ -148,37 +154,70 @@ class ApiKeyService:
         return await user_api_key_dao.delete(db, pk)
 
     @staticmethod
-    async def verify_api_key(db: AsyncSession, api_key: str) -> UserApiKey:
+    async def verify_api_key_with_rate_limits(db: AsyncSession, api_key: str) -> tuple[UserApiKey, dict]:
         """
-        验证 API Key
+        验证 API Key 并获取其速率限制配置
+
+        状态校验与速率限制查询并发执行，速率限制查询使用独立会话
 
         :param db: 数据库会话
         :param api_key: API Key
-        :return: API Key 记录
+        :return: API Key 记录与速率限制配置
         :raises: 验证失败时抛出异常
         """
-        # 计算哈希
-        key_hash = key_encryption.hash_key(api_key)
+        record = await ApiKeyService._lookup_by_hash(db, api_key)
 
-        # 查找记录
+        async def get_rate_limits() -> dict:
+            async with async_db_session() as rate_limit_db:
+                return await ApiKeyService.get_rate_limits(rate_limit_db, record)
+
+        rate_limits_task = asyncio.create_task(get_rate_limits())
+        try:
+            await ApiKeyService._post_validate(db, record)
+        except BaseException:
+            # 校验失败时取消尚未完成的速率限制查询，及时归还连接
+            rate_limits_task.cancel()
+            raise
+        return record, await rate_limits_task
+
+    @staticmethod
+    async def _lookup_by_hash(db: AsyncSession, api_key: str) -> UserApiKey:
+        """
+        按哈希查找 API Key 记录
+
+        :param db: 数据库会话
+        :param api_key: API Key
+        :return: API Key 记录
+        """
+        key_hash = key_encryption.hash_key(api_key)
         record = await user_api_key_dao.get_by_hash(db, key_hash)
         if not record:
             raise errors.AuthorizationError(msg='Invalid API Key')
+        return record
+
+    @staticmethod
+    async def _post_validate(db: AsyncSession, record: UserApiKey) -> None:
+        """
+        校验 API Key 状态与有效期，并更新最后使用时间
 
+        :param db: 数据库会话
+        :param record: API Key 记录
+        :return:
+        """
         # 检查状态
-        if record.status != ApiKeyStatus.ACTIVE:
-            raise errors.AuthorizationError(msg=f'API Key is {record.status.lower()}')
+        if record.status is not ApiKeyStatus.ACTIVE:
+            raise errors.AuthorizationError(msg=f'API Key is {record.status.value.lower()}')
 
         # 检查过期
         if record.expires_at and record.expires_at < timezone.now():
             # 更新状态为过期
             await user_api_key_dao.update(db, record.id, UpdateUserApiKeyParam(status=ApiKeyStatus.EXPIRED))
+            await db.commit()
             raise errors.AuthorizationError(msg='API Key has expired')
 
-        # 更新最后使用时间
+        # 更新最后使用时间；请求会话不会自动提交，这里立即提交以持久化并释放行锁，避免锁持有到整个 LLM 调用结束
         await user_api_key_dao.update_last_used(db, record.id)
-
-        return record
+        await db.commit()
 
     @staticmethod
     async def create_default_key(db: AsyncSession, user_id: int) -> UserApiKey:
@@ -207,8 +246,8 @@ class ApiKeyService:
             key_encrypted=key_encrypted,
         )
 
-        # 保存完整 Key 到临时属性（用于返回给用户）
-        api_key._decrypted_key = full_key
+        # 预置完整 Key（用于返回给用户），避免再次解密
+        api_key.decrypted_key = full_key
 
         return api_key
 
@@ -227,9 +266,7 @@ class ApiKeyService:
 
         # 返回第一个有效的 Key
         for key in keys:
-            if key.status == ApiKeyStatus.ACTIVE:
-                # 解密 Key
-                key._decrypted_key = key_encryption.decrypt(key.key_encrypted)
+            if key.status is ApiKeyStatus.ACTIVE:
                 return key
 
         return None
@@ -248,8 +285,17 @@ class ApiKeyService:
         if existing_key:
             return existing_key
 
-        # 创建新 Key
-        return await ApiKeyService.create_default_key(db, user_id)
+        # 按用户加分布式锁串行化创建，锁内使用独立会话重新检查并提交，避免并发首次登录重复创建
+        async with redis_client.lock(
+            f'{settings.LLM_DEFAULT_KEY_LOCK_REDIS_PREFIX}:{user_id}',
+            timeout=10,
+            blocking_timeout=5,
+        ):
+            async with async_db_session.begin() as lock_db:
+                existing_key = await ApiKeyService.get_default_key(lock_db, user_id)
+                if existing_key:
+                    return existing_key
+                return await ApiKeyService.create_default_key(lock_db, user_id)
 
     @staticmethod
     async def get_rate_limits(db: AsyncSession, api_key: UserApiKey) -> dict:
@@ -1,7 +1,9 @@
 """网关 Service"""
 
 from collections.abc import AsyncIterator
+from typing import Any
 
+from msgspec import DecodeError, json
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from backend.app.llm.core.gateway import llm_gateway
@@ -37,11 +39,8 @@ class GatewayService:
         :param ip_address: IP 地址
         :return: 聊天补全响应
         """
-        # 验证 API Key
-        api_key_record = await api_key_service.verify_api_key(db, api_key)
-
-        # 获取速率限制
-        rate_limits = await api_key_service.get_rate_limits(db, api_key_record)
+        # 验证 API Key 并获取速率限制
+        api_key_record, rate_limits = await api_key_service.verify_api_key_with_rate_limits(db, api_key)
 
         # 调用网关
         return await llm_gateway.chat_completion(
@@ -72,11 +71,8 @@ class GatewayService:
         :param ip_address: IP 地址
         :return: SSE 流
         """
-        # 验证 API Key
-        api_key_record = await api_key_service.verify_api_key(db, api_key)
-
-        # 获取速率限制
-        rate_limits = await api_key_service.get_rate_limits(db, api_key_record)
+        # 验证 API Key 并获取速率限制
+        api_key_record, rate_limits = await api_key_service.verify_api_key_with_rate_limits(db, api_key)
 
         # 调用网关
         async for chunk in llm_gateway.chat_completion_stream(
@@ -91,6 +87,31 @@ class GatewayService:
         ):
             yield chunk
 
+    @staticmethod
+    async def _iter_sse_data(chunks: AsyncIterator[str]) -> AsyncIterator[dict[str, Any]]:
+        """
+        增量解析 SSE 流，逐个产出完整 data 帧的 JSON 数据
+
+        上游分块可能在任意位置截断事件，因此按空行（帧边界）缓冲拼接，仅在帧完整时才进行 JSON 解码
+
+        :param chunks: SSE 文本分块
+        :return:
+        """
+        buffer = bytearray()
+        async for chunk in chunks:
+            buffer += chunk.encode()
+            while (sep := buffer.find(b'\n\n')) != -1:
+                frame = bytes(buffer[:sep])
+                del buffer[: sep + 2]
+                if frame.startswith(b'data: [DONE]'):
+                    return
+                if not frame.startswith(b'data: '):
+                    continue
+                try:
+                    yield json.decode(memoryview(frame)[6:])
+                except DecodeError:
+                    continue
+
     @staticmethod
     def _convert_anthropic_to_openai(request: AnthropicMessageRequest) -> ChatCompletionRequest:
         """将 Anthropic 格式转换为 OpenAI 格式"""
@@ -131,21 +152,22 @@ class GatewayService:
 
         if response.choices:
             choice = response.choices[0]
-            if choice.message.content:
-                content.append(AnthropicContentBlock(type='text', text=choice.message.content))
+            text = choice.message.content
+            if text:
+                content = [AnthropicContentBlock.model_construct(type='text', text=text)]
             stop_reason = choice.finish_reason
 
-        usage = AnthropicUsage(
-            input_tokens=response.usage.prompt_tokens if response.usage else 0,
-            output_tokens=response.usage.completion_tokens if response.usage else 0,
-        )
-
-        return AnthropicMessageResponse(
+        usage = response.usage
+        # 内部生成的数据无需再次校验，直接构造
+        return AnthropicMessageResponse.model_construct(
             id=response.id,
             model=response.model,
             content=content,
             stop_reason=stop_reason,
-            usage=usage,
+            usage=AnthropicUsage.model_construct(
+                input_tokens=usage.prompt_tokens if usage else 0,
+                output_tokens=usage.completion_tokens if usage else 0,
+            ),
         )
 
     async def anthropic_messages(
@@ -196,8 +218,6 @@ class GatewayService:
         :param ip_address: IP 地址
         :return: SSE 流
         """
-        import json
-
         # 转换为 OpenAI 格式
         openai_request = self._convert_anthropic_to_openai(request)
         openai_request.stream = True
@@ -209,30 +229,24 @@ class GatewayService:
         yield 'event: content_block_start\ndata: {"type": "content_block_start", "index": 0, "content_block": {"type": "text", "text": ""}}\n\n'
 
         # 流式转发
-        async for chunk in self.chat_completion_stream(
+        chunks = self.chat_completion_stream(
             db,
             api_key=api_key,
             request=openai_request,
             ip_address=ip_address,
-        ):
-            if chunk.startswith('data: [DONE]'):
-                break
-            if chunk.startswith('data: '):
-                try:
-                    data = json.loads(chunk[6:])
-                    if data.get('choices'):
-                        delta = data['choices'][0].get('delta', {})
-                        content = delta.get('content', '')
-                        if content:
-                            # 转换为 Anthropic 格式
-                            anthropic_chunk = {
-                                'type': 'content_block_delta',
-                                'index': 0,
-                                'delta': {'type': 'text_delta', 'text': content},
-                            }
-                            yield f'event: content_block_delta\ndata: {json.dumps(anthropic_chunk)}\n\n'
-                except json.JSONDecodeError:
-                    pass
+        )
+        async for data in self._iter_sse_data(chunks):
+            if data.get('choices'):
+                delta = data['choices'][0].get('delta', {})
+                content = delta.get('content', '')
+                if content:
+                    # 转换为 Anthropic 格式
+                    anthropic_chunk = {
+                        'type': 'content_block_delta',
+                        'index': 0,
+                        'delta': {'type': 'text_delta', 'text': content},
+                    }
+                    yield f'event: content_block_delta\ndata: {json.encode(anthropic_chunk).decode()}\n\n'
 
         # 发送 content_block_stop 事件
         yield 'event: content_block_stop\ndata: {"type": "content_block_stop", "index": 0}\n\n'
@@ -4,17 +4,21 @@ from typing import Any
 
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from backend.app.llm.core.concurrency import db_query_semaphore
 from backend.app.llm.crud.crud_model_config import model_config_dao
-from backend.app.llm.crud.crud_provider import provider_dao
 from backend.app.llm.model.model_config import ModelConfig
 from backend.app.llm.schema.model_config import (
+    BulkUpdateModelConfigParam,
     CreateModelConfigParam,
     GetAvailableModel,
     GetModelConfigDetail,
     UpdateModelConfigParam,
 )
+from backend.common.cache.decorator import cache_invalidate, cached
 from backend.common.exception import errors
-from backend.common.pagination import paging_data
+from backend.common.pagination import paging_data_concurrent
+from backend.common.schema import fast_build
+from backend.core.conf import settings
 
 
 class ModelService:
@@ -35,28 +39,7 @@ class ModelService:
         if not model:
             raise errors.NotFoundError(msg='模型不存在')
 
-        provider = await provider_dao.get(db, model.provider_id)
-        provider_name = provider.name if provider else None
-
-        return GetModelConfigDetail(
-            id=model.id,
-            provider_id=model.provider_id,
-            provider_name=provider_name,
-            model_name=model.model_name,
-            display_name=model.display_name,
-            model_type=model.model_type,
-            max_tokens=model.max_tokens,
-            max_context_length=model.max_context_length,
-            supports_streaming=model.supports_streaming,
-            supports_tools=model.supports_tools,
-            supports_vision=model.supports_vision,
-            input_cost_per_1k=model.input_cost_per_1k,
-            output_cost_per_1k=model.output_cost_per_1k,
-            rpm_limit=model.rpm_limit,
-            tpm_limit=model.tpm_limit,
-            priority=model.priority,
-            enabled=model.enabled,
-        )
+        return GetModelConfigDetail.model_validate(model, from_attributes=True)
 
     @staticmethod
     async def get_list(
@@ -74,76 +57,83 @@ class ModelService:
             model_name=model_name,
             enabled=enabled,
         )
-        page_data = await paging_data(db, stmt)
+        async with db_query_semaphore:
+            page_data = await paging_data_concurrent(db, stmt)
         return page_data
 
     @staticmethod
-    async def get_available_models(db: AsyncSession) -> list[GetAvailableModel]:
+    @cached(settings.CACHE_LLM_MODEL_REDIS_PREFIX)
+    async def get_available_models(db: AsyncSession) -> list[dict[str, Any]]:
         """
         获取可用模型列表（公开接口）
 
-        返回格式与 agent-core ModelInfo 对应
+        返回格式与 agent-core ModelInfo 对应，结果经缓存，模型或供应商变更时失效
         """
-        models = await model_config_dao.get_all_enabled(db)
-        return [
-            GetAvailableModel(
-                model_id=m.model_name,
-                provider=m.provider.provider_type if m.provider else 'openai',
-                display_name=m.display_name or m.model_name,
-                max_tokens=m.max_tokens,
-                model_type=m.model_type,
-                supports_streaming=m.supports_streaming,
-                supports_vision=m.supports_vision,
-                supports_tools=m.supports_tools,
-                priority=m.priority,
-                enabled=m.enabled,
-            )
-            for m in models
-        ]
+        stmt = await model_config_dao.get_all_enabled()
+        async with db_query_semaphore:
+            result = await db.stream(stmt)
+            return [fast_build(GetAvailableModel, m).model_dump() async for m in result]
 
     @staticmethod
+    @cache_invalidate(settings.CACHE_LLM_MODEL_REDIS_PREFIX)
     async def create(db: AsyncSession, obj: CreateModelConfigParam) -> None:
         """创建模型配置"""
-        # 检查供应商是否存在
-        provider = await provider_dao.get(db, obj.provider_id)
-        if not provider:
+        provider_exists, name_taken = await model_config_dao.validate_create(db, obj.provider_id, obj.model_name)
+        if not provider_exists:
             raise errors.NotFoundError(msg='供应商不存在')
-
-        # 检查模型名称是否已存在
-        existing = await model_config_dao.get_by_name(db, obj.model_name)
-        if existing:
+        if name_taken:
             raise errors.ForbiddenError(msg='模型名称已存在')
 
         await model_config_dao.create(db, obj)
 
     @staticmethod
+    @cache_invalidate(settings.CACHE_LLM_MODEL_REDIS_PREFIX)
     async def update(db: AsyncSession, pk: int, obj: UpdateModelConfigParam) -> int:
         """更新模型配置"""
-        model = await model_config_dao.get(db, pk)
-        if not model:
+        # 检查供应商是否存在及模型名称是否重复
+        provider_id = obj.provider_id or None
+        model_name = obj.model_name or None
+        if provider_id is not None or model_name is not None:
+            provider_exists, name_taken = await model_config_dao.validate_create(
+                db, provider_id, model_name, exclude_pk=pk
+            )
+            if not provider_exists:
+                raise errors.NotFoundError(msg='供应商不存在')
+            if name_taken:
+                raise errors.ForbiddenError(msg='模型名称已存在')
+
+        count = await model_config_dao.update(db, pk, obj)
+        if not count:
             raise errors.NotFoundError(msg='模型不存在')
+        return count
 
-        # 检查供应商是否存在
-        if obj.provider_id:
-            provider = await provider_dao.get(db, obj.provider_id)
-            if not provider:
+    @staticmethod
+    @cache_invalidate(settings.CACHE_LLM_MODEL_REDIS_PREFIX)
+    async def bulk_update(db: AsyncSession, obj: BulkUpdateModelConfigParam) -> int:
+        """批量更新模型配置（如批量启用/禁用）"""
+        if obj.model_name is not None:
+            raise errors.ForbiddenError(msg='批量更新不支持修改模型名称')
+        if obj.provider_id is not None:
+            provider_exists, _ = await model_config_dao.validate_create(db, obj.provider_id, None)
+            if not provider_exists:
                 raise errors.NotFoundError(msg='供应商不存在')
 
-        # 检查模型名称是否重复
-        if obj.model_name and obj.model_name != model.model_name:
-            existing = await model_config_dao.get_by_name(db, obj.model_name)
-            if existing:
-                raise errors.ForbiddenError(msg='模型名称已存在')
-
-        return await model_config_dao.update(db, pk, obj)
+        values = obj.model_dump(exclude={'pks'}, exclude_unset=True)
+        if not values:
+            raise errors.RequestError(msg='未提供需要更新的字段')
+        count = await model_config_dao.bulk_update(db, obj.pks, values)
+        if not count:
+            raise errors.NotFoundError(msg='模型不存在')
+        return count
 
     @staticmethod
+    @cache_invalidate(settings.CACHE_LLM_MODEL_REDIS_PREFIX)
     async def delete(db: AsyncSession, pk: int) -> int:
         """删除模型配置"""
-        model = await model_config_dao.get(db, pk)
-        if not model:
+        count = await model_config_dao.delete(db, pk)
+        if not count:
             raise errors.NotFoundError(msg='模型不存在')
-        return await model_config_dao.delete(db, pk)
+        return count
 
 
 model_service = ModelService()
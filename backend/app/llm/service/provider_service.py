@@ -1,19 +1,47 @@
 """模型供应商 Service"""
 
+import dataclasses
+
 from typing import Any
 
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from backend.app.llm.core.concurrency import db_query_semaphore
 from backend.app.llm.core.encryption import key_encryption
 from backend.app.llm.crud.crud_provider import provider_dao
 from backend.app.llm.model.provider import ModelProvider
 from backend.app.llm.schema.provider import (
+    BulkUpdateProviderParam,
     CreateProviderParam,
     GetProviderDetail,
     UpdateProviderParam,
 )
+from backend.common.cache.decorator import cache_invalidate, cached
 from backend.common.exception import errors
-from backend.common.pagination import paging_data
+from backend.common.pagination import paging_data_concurrent
+from backend.core.conf import settings
+
+
+@dataclasses.dataclass(frozen=True, slots=True)
+class ProviderSnapshot:
+    """网关调用所需的供应商只读快照"""
+
+    id: int
+    name: str
+    provider_type: str
+    api_base_url: str | None
+    api_key_encrypted: str | None
+    enabled: bool
+
+
+def _provider_key_builder(db: AsyncSession, pk: int, *args: Any, **kwargs: Any) -> str:
+    """按供应商 ID 生成缓存 Key"""
+    return str(pk)
+
+
+def _all_providers_key_builder(*args: Any, **kwargs: Any) -> str:
+    """生成覆盖全部供应商的缓存 Key 前缀"""
+    return ''
 
 
 class ProviderService:
@@ -27,6 +55,33 @@ class ProviderService:
             raise errors.NotFoundError(msg='供应商不存在')
         return provider
 
+    @staticmethod
+    @cached(settings.CACHE_LLM_PROVIDER_REDIS_PREFIX, key_builder=_provider_key_builder)
+    async def _get_snapshot_data(db: AsyncSession, pk: int) -> dict[str, Any] | None:
+        """
+        获取供应商快照数据（经 L1/L2 缓存，写操作时跨进程失效）
+
+        :param db: 数据库会话
+        :param pk: 供应商 ID
+        :return:
+        """
+        provider = await provider_dao.get(db, pk)
+        if not provider:
+            return None
+        return {field.name: getattr(provider, field.name) for field in dataclasses.fields(ProviderSnapshot)}
+
+    @staticmethod
+    async def get_cached(db: AsyncSession, pk: int) -> ProviderSnapshot | None:
+        """
+        获取供应商只读快照（优先读取缓存）
+
+        :param db: 数据库会话
+        :param pk: 供应商 ID
+        :return:
+        """
+        data = await ProviderService._get_snapshot_data(db, pk)
+        return ProviderSnapshot(**data) if data else None
+
     @staticmethod
     async def get_detail(db: AsyncSession, pk: int) -> GetProviderDetail:
         """获取供应商详情（带 API Key 状态）"""
@@ -44,7 +99,8 @@ class ProviderService:
     ) -> dict[str, Any]:
         """获取供应商列表（分页）"""
         stmt = await provider_dao.get_list(name=name, enabled=enabled)
-        page_data = await paging_data(db, stmt)
+        async with db_query_semaphore:
+            page_data = await paging_data_concurrent(db, stmt)
         return page_data
 
     @staticmethod
@@ -53,6 +109,7 @@ class ProviderService:
         return await provider_dao.get_all_enabled(db)
 
     @staticmethod
+    @cache_invalidate(settings.CACHE_LLM_MODEL_REDIS_PREFIX)
     async def create(db: AsyncSession, obj: CreateProviderParam) -> None:
         """创建供应商"""
         # 检查名称是否已存在
@@ -68,16 +125,14 @@ class ProviderService:
         await provider_dao.create(db, obj, api_key_encrypted)
 
     @staticmethod
+    @cache_invalidate(settings.CACHE_LLM_MODEL_REDIS_PREFIX)
+    @cache_invalidate(settings.CACHE_LLM_PROVIDER_REDIS_PREFIX, key_builder=_provider_key_builder)
     async def update(db: AsyncSession, pk: int, obj: UpdateProviderParam) -> int:
         """更新供应商"""
-        provider = await provider_dao.get(db, pk)
-        if not provider:
-            raise errors.NotFoundError(msg='供应商不存在')
-
         # 检查名称是否重复
-        if obj.name and obj.name != provider.name:
+        if obj.name:
             existing = await provider_dao.get_by_name(db, obj.name)
-            if existing:
+            if existing and existing.id != pk:
                 raise errors.ForbiddenError(msg='供应商名称已存在')
 
         # 加密 API Key
@@ -85,15 +140,39 @@ class ProviderService:
         if obj.api_key:
             api_key_encrypted = key_encryption.encrypt(obj.api_key)
 
-        return await provider_dao.update(db, pk, obj, api_key_encrypted)
+        count = await provider_dao.update(db, pk, obj, api_key_encrypted)
+        if not count:
+            raise errors.NotFoundError(msg='供应商不存在')
+        return count
 
     @staticmethod
+    @cache_invalidate(settings.CACHE_LLM_MODEL_REDIS_PREFIX)
+    @cache_invalidate(settings.CACHE_LLM_PROVIDER_REDIS_PREFIX, key_builder=_all_providers_key_builder)
+    async def bulk_update(db: AsyncSession, obj: BulkUpdateProviderParam) -> int:
+        """批量更新供应商（如批量启用/禁用）"""
+        if obj.name:
+            raise errors.ForbiddenError(msg='批量更新不支持修改供应商名称')
+
+        values = obj.model_dump(exclude={'pks', 'api_key'}, exclude_none=True)
+        if obj.api_key:
+            values['api_key_encrypted'] = key_encryption.encrypt(obj.api_key)
+        if not values:
+            raise errors.RequestError(msg='未提供需要更新的字段')
+
+        count = await provider_dao.bulk_update(db, obj.pks, values)
+        if not count:
+            raise errors.NotFoundError(msg='供应商不存在')
+        return count
+
+    @staticmethod
+    @cache_invalidate(settings.CACHE_LLM_MODEL_REDIS_PREFIX)
+    @cache_invalidate(settings.CACHE_LLM_PROVIDER_REDIS_PREFIX, key_builder=_provider_key_builder)
     async def delete(db: AsyncSession, pk: int) -> int:
         """删除供应商"""
-        provider = await provider_dao.get(db, pk)
-        if not provider:
+        count = await provider_dao.delete(db, pk)
+        if not count:
             raise errors.NotFoundError(msg='供应商不存在')
-        return await provider_dao.delete(db, pk)
+        return count
 
 
 provider_service = ProviderService()
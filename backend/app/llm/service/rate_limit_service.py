@@ -8,6 +8,7 @@ from typing import Any
 
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from backend.app.llm.core.concurrency import db_query_semaphore
 from backend.app.llm.crud.crud_rate_limit import rate_limit_dao
 from backend.app.llm.model.rate_limit import RateLimitConfig
 from backend.app.llm.schema.rate_limit import (
@@ -16,7 +17,7 @@ from backend.app.llm.schema.rate_limit import (
     UpdateRateLimitConfigParam,
 )
 from backend.common.exception import errors
-from backend.common.pagination import paging_data
+from backend.common.pagination import paging_data_concurrent
 
 
 class RateLimitService:
@@ -47,7 +48,8 @@ class RateLimitService:
     ) -> dict[str, Any]:
         """获取速率限制配置列表（分页）"""
         stmt = await rate_limit_dao.get_list(name=name, enabled=enabled)
-        page_data = await paging_data(db, stmt)
+        async with db_query_semaphore:
+            page_data = await paging_data_concurrent(db, stmt)
         return page_data
 
     @staticmethod
@@ -61,22 +63,22 @@ class RateLimitService:
     @staticmethod
     async def update(db: AsyncSession, pk: int, obj: UpdateRateLimitConfigParam) -> int:
         """更新速率限制配置"""
-        config = await rate_limit_dao.get(db, pk)
-        if not config:
-            raise errors.NotFoundError(msg='速率限制配置不存在')
-        if obj.name and obj.name != config.name:
+        if obj.name:
             existing = await rate_limit_dao.get_by_name(db, obj.name)
-            if existing:
+            if existing and existing.id != pk:
                 raise errors.ForbiddenError(msg='配置名称已存在')
-        return await rate_limit_dao.update(db, pk, obj)
+        count = await rate_limit_dao.update(db, pk, obj)
+        if not count:
+            raise errors.NotFoundError(msg='速率限制配置不存在')
+        return count
 
     @staticmethod
     async def delete(db: AsyncSession, pk: int) -> int:
         """删除速率限制配置"""
-        config = await rate_limit_dao.get(db, pk)
-        if not config:
+        count = await rate_limit_dao.delete(db, pk)
+        if not count:
             raise errors.NotFoundError(msg='速率限制配置不存在')
-        return await rate_limit_dao.delete(db, pk)
+        return count
 
 
 rate_limit_service = RateLimitService()
@@ -1,19 +1,24 @@
 """用量统计 Service"""
 
+from collections import defaultdict
 from datetime import date
+from decimal import Decimal
+from operator import attrgetter
 from typing import Any
 
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from backend.app.llm.core.concurrency import db_query_semaphore
 from backend.app.llm.core.rate_limiter import rate_limiter
 from backend.app.llm.crud.crud_usage_log import usage_log_dao
 from backend.app.llm.schema.usage_log import (
     DailyUsage,
     ModelUsage,
     QuotaInfo,
+    UsageDashboard,
     UsageSummary,
 )
-from backend.common.pagination import paging_data
+from backend.common.pagination import paging_data_concurrent
 
 
 class UsageService:
@@ -28,12 +33,13 @@ class UsageService:
         end_date: date | None = None,
     ) -> UsageSummary:
         """获取用量汇总"""
-        return await usage_log_dao.get_summary(
-            db,
-            user_id=user_id,
-            start_date=start_date,
-            end_date=end_date,
-        )
+        async with db_query_semaphore:
+            return await usage_log_dao.get_summary(
+                db,
+                user_id=user_id,
+                start_date=start_date,
+                end_date=end_date,
+            )
 
     @staticmethod
     async def get_daily_usage(
@@ -43,7 +49,8 @@ class UsageService:
         days: int = 30,
     ) -> list[DailyUsage]:
         """获取每日用量"""
-        return await usage_log_dao.get_daily_usage(db, user_id=user_id, days=days)
+        async with db_query_semaphore:
+            return await usage_log_dao.get_daily_usage(db, user_id=user_id, days=days)
 
     @staticmethod
     async def get_model_usage(
@@ -54,11 +61,62 @@ class UsageService:
         end_date: date | None = None,
     ) -> list[ModelUsage]:
         """获取模型用量"""
-        return await usage_log_dao.get_model_usage(
-            db,
-            user_id=user_id,
-            start_date=start_date,
-            end_date=end_date,
+        async with db_query_semaphore:
+            return await usage_log_dao.get_model_usage(
+                db,
+                user_id=user_id,
+                start_date=start_date,
+                end_date=end_date,
+            )
+
+    @staticmethod
+    async def get_dashboard(db: AsyncSession, *, user_id: int, days: int = 30) -> UsageDashboard:
+        """获取用量看板（汇总、每日用量及模型用量），单次查询后在内存中拆分"""
+        async with db_query_semaphore:
+            rows = await usage_log_dao.get_dashboard(db, user_id=user_id, days=days)
+
+        requests = success_requests = error_requests = latency_ms = 0
+        tokens = input_tokens = output_tokens = 0
+        cost = Decimal(0)
+        daily: defaultdict[str, list] = defaultdict(lambda: [0, 0, Decimal(0)])
+        models: defaultdict[str, list] = defaultdict(lambda: [0, 0, Decimal(0)])
+        for row in rows:
+            requests += row.requests
+            success_requests += int(row.success_requests or 0)
+            error_requests += int(row.error_requests or 0)
+            tokens += int(row.tokens)
+            input_tokens += int(row.input_tokens)
+            output_tokens += int(row.output_tokens)
+            cost += row.cost
+            latency_ms += int(row.latency_ms)
+            for bucket in (daily[str(row.date)], models[row.model_name]):
+                bucket[0] += row.requests
+                bucket[1] += int(row.tokens)
+                bucket[2] += row.cost
+
+        return UsageDashboard(
+            summary=UsageSummary(
+                total_requests=requests,
+                success_requests=success_requests,
+                error_requests=error_requests,
+                total_tokens=tokens,
+                total_input_tokens=input_tokens,
+                total_output_tokens=output_tokens,
+                total_cost=cost,
+                avg_latency_ms=latency_ms // requests if requests else 0,
+            ),
+            daily=[
+                DailyUsage.model_construct(date=day, requests=r, tokens=t, cost=c)
+                for day, (r, t, c) in sorted(daily.items())
+            ],
+            models=sorted(
+                (
+                    ModelUsage.model_construct(model_name=name, requests=r, tokens=t, cost=c)
+                    for name, (r, t, c) in models.items()
+                ),
+                key=attrgetter('tokens'),
+                reverse=True,
+            ),
         )
 
     @staticmethod
@@ -81,7 +139,8 @@ class UsageService:
             start_date=start_date,
             end_date=end_date,
         )
-        page_data = await paging_data(db, stmt)
+        async with db_query_semaphore:
+            page_data = await paging_data_concurrent(db, stmt)
         return page_data
 
     @staticmethod
@@ -0,0 +1,16 @@
+import pytest
+
+from starlette.testclient import TestClient
+
+
+@pytest.mark.parametrize('path', ['/llm/providers', '/llm/models', '/llm/rate-limits'])
+def test_concurrent_paging(client: TestClient, token_headers: dict[str, str], path: str) -> None:
+    response = client.get(path, headers=token_headers, params={'page': 1, 'size': 1})
+    assert response.status_code == 200
+    data = response.json()['data']
+    assert data['page'] == 1
+    assert data['size'] == 1
+    assert len(data['items']) <= 1
+    assert data['total'] >= len(data['items'])
+    assert data['total_pages'] == data['total']
+    assert data['links']['self']
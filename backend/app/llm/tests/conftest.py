@@ -0,0 +1,3 @@
+from backend.app.admin.tests.conftest import client, token_headers
+
+__all__ = ['client', 'token_headers']
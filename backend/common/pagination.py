@@ -1,19 +1,22 @@
 from __future__ import annotations
 
+import asyncio
+
 from collections.abc import Sequence
 from math import ceil
 from typing import TYPE_CHECKING, Any, Generic, TypeVar
 
 from fastapi import Depends, Query
 from fastapi_pagination import pagination_ctx
+from fastapi_pagination.api import create_page, resolve_params
 from fastapi_pagination.bases import AbstractPage, AbstractParams, RawParams
-from fastapi_pagination.ext.sqlalchemy import apaginate
+from fastapi_pagination.ext.sqlalchemy import apaginate, create_count_query, create_paginate_query
 from fastapi_pagination.links.bases import create_links
 from pydantic import BaseModel, Field
+from sqlalchemy.ext.asyncio import AsyncSession
 
 if TYPE_CHECKING:
     from sqlalchemy import Select
-    from sqlalchemy.ext.asyncio import AsyncSession
     from typing_extensions import Self
 
 T = TypeVar('T')
@@ -125,5 +128,31 @@ async def paging_data(db: AsyncSession, select: Select, **kwargs) -> dict[str, A
     return page_data
 
 
+async def paging_data_concurrent(db: AsyncSession, select: Select) -> dict[str, Any]:
+    """
+    基于 SQLAlchemy 创建分页数据，分页查询使用当前会话，总数查询使用同源独立会话并发执行
+
+    :param db: 数据库会话
+    :param select: SQL 查询语句
+    :return:
+    """
+    params = resolve_params()
+    columns = select.column_descriptions
+    unwrap = len(columns) == 1 and isinstance(columns[0]['expr'], type)
+
+    async def count() -> int:
+        async with AsyncSession(db.bind) as session:
+            return await session.scalar(create_count_query(select)) or 0
+
+    async def items() -> list[Any]:
+        result = await db.execute(create_paginate_query(select, params))
+        return list(result.scalars().all() if unwrap else result.all())
+
+    total, page_items = await asyncio.gather(count(), items())
+    paginated_data: _CustomPage = create_page(page_items, total=total, params=params)
+    page_data = paginated_data.model_dump()
+    return page_data
+
+
 # 分页依赖注入
 DependsPagination = Depends(pagination_ctx(_CustomPage))
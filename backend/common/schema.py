@@ -1,5 +1,5 @@
 from datetime import datetime
-from typing import Annotated, Any
+from typing import Annotated, Any, TypeVar
 
 from pydantic import BaseModel, ConfigDict, EmailStr, Field, validate_email
 
@@ -7,6 +7,8 @@ from backend.common.enums import PrimaryKeyType
 from backend.core.conf import settings
 from backend.utils.timezone import timezone
 
+SchemaT = TypeVar('SchemaT', bound=BaseModel)
+
 CustomPhoneNumber = Annotated[str, Field(pattern=r'^1[3-9]\d{9}$')]
 
 
@@ -47,3 +49,14 @@ def ser_string(value: Any) -> str | None:
     if value:
         return str(value)
     return value
+
+
+def fast_build(cls: type[SchemaT], obj: Any) -> SchemaT:
+    """
+    按字段读取对象属性构建 Schema，跳过校验，仅用于数据库来源的可信数据
+
+    :param cls: Schema 类
+    :param obj: ORM 对象或查询结果行
+    :return:
+    """
+    return cls.model_construct(**{field: getattr(obj, field) for field in cls.model_fields})
@@ -75,6 +75,8 @@ class Settings(BaseSettings):
     CACHE_REDIS_TTL: int = 60 * 60 * 2  # 2 小时
     CACHE_CONFIG_REDIS_PREFIX: str = 'fba:cache:config'
     CACHE_DICT_REDIS_PREFIX: str = 'fba:cache:dict'
+    CACHE_LLM_MODEL_REDIS_PREFIX: str = 'fba:cache:llm:model'
+    CACHE_LLM_PROVIDER_REDIS_PREFIX: str = 'fba:cache:llm:provider'
     CACHE_PUBSUB_CHANNEL: str = 'fba:cache:invalidate'
     CACHE_PUBSUB_RECONNECT_DELAY: int = 5  # 重连延迟（秒）
     CACHE_PUBSUB_MAX_RECONNECT_ATTEMPTS: int = 10  # 最大重连次数
@@ -290,6 +292,12 @@ class Settings(BaseSettings):
     ##################################################
     # .env LLM 网关加密密钥
     LLM_ENCRYPTION_KEY: str = ''  # Fernet 加密密钥 (可通过 Fernet.generate_key() 生成)
+    LLM_DEFAULT_KEY_LOCK_REDIS_PREFIX: str = 'fba:llm:default_key:lock'
+    LLM_DB_CONCURRENCY: int = 8  # 列表/统计类查询并发上限，需小于数据库连接池容量
+    LLM_USAGE_LOG_QUEUE_MAXSIZE: int = 100000
+    LLM_USAGE_LOG_QUEUE_BATCH_CONSUME_SIZE: int = 500
+    LLM_USAGE_LOG_QUEUE_TIMEOUT: int = 5  # 5 秒
+    LLM_USAGE_LOG_WRITE_RETRIES: int = 3
 
     ##################################################
     # [ SMS ] Aliyun
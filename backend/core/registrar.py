@@ -17,6 +17,7 @@ from starlette_context.middleware import ContextMiddleware
 from starlette_context.plugins import RequestIdPlugin
 
 from backend import __version__
+from backend.app.llm.core.usage_tracker import UsageTracker
 from backend.common.cache.pubsub import cache_pubsub_manager
 from backend.common.cache.warmup import cache_warmup
 from backend.common.exception.exception_handler import register_exception
@@ -68,6 +69,9 @@ async def register_init(app: FastAPI) -> AsyncGenerator[None, None]:
     # 创建操作日志任务
     create_task(OperaLogMiddleware.consumer())
 
+    # 创建 LLM 用量日志任务
+    usage_log_task = create_task(UsageTracker.consumer())
+
     # 缓存预热
     await cache_warmup()
 
@@ -76,6 +80,9 @@ async def register_init(app: FastAPI) -> AsyncGenerator[None, None]:
 
     yield
 
+    # 写入剩余 LLM 用量日志
+    await UsageTracker.shutdown(usage_log_task)
+
     # 停止缓存 Pub/Sub 监听器
     await cache_pubsub_manager.stop_listener()
 